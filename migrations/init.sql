@@ -5,6 +5,40 @@ CREATE TABLE IF NOT EXISTS movie_reviews (
     movie_id TEXT NOT NULL,
     movie_name TEXT NOT NULL,
     review_score INT NOT NULL,
-    review_time TIMESTAMP NOT NULL,
+    review_time TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc'),
     PRIMARY KEY (guild_id, user_id, movie_id)
 );
+
+-- Keeps databases created before review_time had a default up to date.
+-- Guarded so the ACCESS EXCLUSIVE lock is only taken when it is missing.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+            AND table_name = 'movie_reviews'
+            AND column_name = 'review_time'
+            AND column_default IS NULL
+    ) THEN
+        ALTER TABLE movie_reviews
+            ALTER COLUMN review_time SET DEFAULT (now() AT TIME ZONE 'utc');
+    END IF;
+END
+$$;
+
+CREATE INDEX IF NOT EXISTS movie_reviews_guild_movie_idx
+    ON movie_reviews (guild_id, movie_id) INCLUDE (movie_name, review_score);
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS movie_reviews_movie_name_trgm_idx
+    ON movie_reviews USING gin (lower(movie_name) gin_trgm_ops);
+
+CREATE TABLE IF NOT EXISTS movies (
+    movie_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    year TEXT,
+    poster TEXT,
+    imdb_rating TEXT,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
@@ -0,0 +1,188 @@
+"""
+This module contains the RumbleReviewsBot client.
+"""
+
+import logging as logger
+import os
+
+import aiohttp
+import asyncpg  # type: ignore[import-untyped]
+import discord
+from discord.ext import commands
+
+from rumble.credentials.loader import EnvLoader
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, "migrations", "init.sql"
+)
+# Seconds allowed for applying the schema, which may build indexes.
+SCHEMA_TIMEOUT = 600
+
+
+class RumbleReviewsBot(commands.Bot):
+    """A class to represent the RumbleReviewsBot."""
+
+    def __init__(self, env_loader: EnvLoader) -> None:
+        """Initialize the RumbleReviewsBot."""
+        intents = discord.Intents(
+            guilds=True, guild_messages=True, message_content=True
+        )
+        self.env_loader: EnvLoader = env_loader
+        self.pg_pool: asyncpg.Pool | None = None
+        self.http_session: aiohttp.ClientSession | None = None
+        command_prefix = "$$$"
+        help_command = None
+        activity = discord.Activity(
+            type=discord.ActivityType.watching,
+            name="Movies/TV Shows",
+        )
+
+        super().__init__(
+            intents=intents,
+            command_prefix=command_prefix,
+            help_command=help_command,
+            activity=activity,
+        )
+
+    async def setup_hook(self) -> None:
+        """
+        Setup hook, better than putting this in on_ready event.
+
+        Application commands are not synced here, run the ``$$$sync`` owner
+        command after deploying changes to slash commands.
+        """
+        logger.info("Setting up the Hook!")
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=5, connect=2),
+            raise_for_status=False,
+        )
+        self.pg_pool = await asyncpg.create_pool(  # type: ignore
+            dsn=self.env_loader.DATABASE_URL,
+            min_size=self.env_loader.DB_POOL_MIN_SIZE,
+            max_size=self.env_loader.DB_POOL_MAX_SIZE,
+            max_inactive_connection_lifetime=self.env_loader.DB_POOL_MAX_INACTIVE_LIFETIME,
+            command_timeout=self.env_loader.DB_COMMAND_TIMEOUT,
+            # A startup parameter, so it survives the RESET ALL on release.
+            server_settings={
+                "statement_timeout": str(int(self.env_loader.DB_COMMAND_TIMEOUT * 1000))
+            },
+        )
+        await self._ensure_schema()
+
+    async def _ensure_schema(self) -> None:
+        """
+        Apply the idempotent schema in ``migrations/init.sql``.
+
+        The Postgres image only runs it when the data volume is first created,
+        running it on startup brings existing databases up to date as well.
+        Building an index on a large existing table can take a while, so it
+        runs with SCHEMA_TIMEOUT instead of the usual command timeouts.
+        """
+        with open(SCHEMA_PATH, "rt", encoding="utf-8") as file:
+            schema = file.read()
+        async with self.pg_pool.acquire() as conn:  # type: ignore
+            async with conn.transaction():  # type: ignore
+                await conn.execute(  # type: ignore
+                    f"SET LOCAL statement_timeout = {SCHEMA_TIMEOUT * 1000}"
+                )
+                # asyncpg reads timeout=None as "use command_timeout".
+                await conn.execute(schema, timeout=SCHEMA_TIMEOUT)  # type: ignore
+
+    async def close(self) -> None:
+        """
+        Close the bot and cleanup
+        """
+        logger.info("Closing the bot")
+        # Unloads the cogs first, which may still flush queued writes.
+        await super().close()
+        await self.pg_pool.close()  # type: ignore
+        if self.http_session is not None:
+            await self.http_session.close()
+
+    async def on_ready(self) -> None:
+        """This event runs when the bot is connected and ready to be used."""
+        lines = "~~~" * 30
+        logger.info(
+            "\n%s\n%s is online in %s servers, and is ready to review movies!\n%s",
+            lines,
+            self.user,
+            len(self.guilds),
+            lines,
+        )
+
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        """This event runs when the bot joins a new guild."""
+        join_msg = (
+            "Rumble, your personal Movie rater is here!\n\n"
+            "Ready to review some movies? Start by using my slash commands. Simply type ``/review`` followed by a movie title, show title or direct IMDB link to get started.\n\n"
+            "Looking for more? Just type ``/`` and choose Rumble, to explore all the commands.\n\n"
+        )
+        logger.info(
+            "Rumble has joined %s, this guild has %s members",
+            guild.name,
+            guild.member_count,
+        )
+
+        me = guild.me
+        if (
+            guild.system_channel
+            and guild.system_channel.permissions_for(me).send_messages
+        ):
+            try:
+                await guild.system_channel.send(join_msg)
+                return
+            except discord.HTTPException as exc:
+                logger.exception("Failed to send message to system channel")
+                raise exc
+
+        # Prefer a "general" or "bot" channel, otherwise fall back to the first
+        # channel we can write in. Permissions are computed once per channel.
+        channel_to_send: discord.TextChannel | None = None
+        for channel in guild.text_channels:
+            if channel.is_nsfw() or not channel.permissions_for(me).send_messages:
+                continue
+            if "general" in channel.name.lower() or "bot" in channel.name.lower():
+                channel_to_send = channel
+                break
+            if channel_to_send is None:
+                channel_to_send = channel
+        logger.info("Channel to send join message: %s", channel_to_send)
+
+        if channel_to_send is None:
+            try:
+                # Without the members intent the owner is rarely cached.
+                owner = guild.owner or await guild.fetch_member(guild.owner_id)  # type: ignore
+                if not isinstance(owner, discord.Member):
+                    logger.error("Guild owner is not a member")
+                    return
+
+                await owner.send(
+                    "Thanks for inviting Rumble.\n\n"
+                    f"It seems like I can't send messages in {guild.name}.\n"
+                    "Please give permissions to send messages in text channels.\n"
+                    "Otherwise i am kinda useless :(\n\n\n"
+                    "When i have permission to send messages in text channels, "
+                    "try to use the ``/`` and select me to see what i can do :)"
+                )
+            except discord.Forbidden:
+                logger.error("Guild owner has disabled DM's" * 10)
+            except discord.HTTPException:
+                logger.exception("Failed to message the owner of %s", guild.name)
+            return
+
+        await channel_to_send.send(join_msg)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        """This event runs when the bot leaves a guild."""
+        logger.info(
+            "Rumble has left %s, this guild had %s members",
+            guild.name,
+            guild.member_count,
+        )
@@ -2,34 +2,140 @@
 This module contains the Review cog for the RumbleReviewsBot.
 """
 
-import datetime
+import asyncio
+import functools
 import logging as logger
+import re
 from typing import Any, List, Optional
 
 import aiohttp
+import asyncpg  # type: ignore[import-untyped]
 import discord
+import msgspec
+from cachetools import TTLCache
 from discord import app_commands
 from discord.ext import commands
 
-from rumble.__main__ import RumbleReviewsBot
-from rumble.models.omdb import OmdbMovie, OmdbSearch
+from rumble.bot import RumbleReviewsBot
+from rumble.models.omdb import OmdbError, OmdbMovie, OmdbSearch, OmdbSearchResults
+
+OMDB_API_URL = "http://www.omdbapi.com/"
+OMDB_MAX_CONCURRENCY = 10
+# Background prefetches only ever take this many of the slots above.
+OMDB_PREFETCH_CONCURRENCY = 2
+# Discord API lookups of review authors missing from every cache.
+USER_FETCH_CONCURRENCY = 4
+
+_SEARCH_DECODER = msgspec.json.Decoder(OmdbSearchResults | OmdbError)
+_MOVIE_DECODER = msgspec.json.Decoder(OmdbMovie | OmdbError)
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+REVIEW_BATCH_SIZE = 100
+REVIEW_BATCH_DELAY = 0.05
+
+# (movie upsert args, review upsert args) waiting to be written.
+_PendingReview = tuple[tuple[Any, ...], tuple[Any, ...]]
+
+# Conflicting rows are only rewritten when a value actually changed, so
+# re-submitting the same movie or score doesn't produce dead tuples or WAL.
+_SQL_UPSERT_MOVIE = """
+INSERT INTO movies (movie_id, title, year, poster, imdb_rating, updated_at)
+VALUES ($1, $2, $3, $4, $5, now())
+ON CONFLICT (movie_id) DO UPDATE
+SET title = EXCLUDED.title, year = EXCLUDED.year, poster = EXCLUDED.poster,
+    imdb_rating = EXCLUDED.imdb_rating, updated_at = EXCLUDED.updated_at
+WHERE (movies.title, movies.year, movies.poster, movies.imdb_rating)
+    IS DISTINCT FROM (EXCLUDED.title, EXCLUDED.year, EXCLUDED.poster, EXCLUDED.imdb_rating)
+"""
+
+_SQL_UPSERT_REVIEW = """
+INSERT INTO movie_reviews (guild_id, user_id, user_name, movie_id, movie_name, review_score)
+VALUES ($1, $2, $3, $4, $5, $6)
+ON CONFLICT (guild_id, user_id, movie_id) DO UPDATE
+SET review_score = EXCLUDED.review_score, review_time = EXCLUDED.review_time
+WHERE movie_reviews.review_score IS DISTINCT FROM EXCLUDED.review_score
+"""
+
+# Discord embeds hold at most 25 fields, so only the top 25 movies are listed.
+_SQL_LIST_REVIEWS = """
+SELECT r.movie_id, m.movie_id IS NULL as missing,
+       COALESCE(m.title, r.movie_name) as title,
+       COALESCE(NULLIF(m.year, ''), 'N/A') as year,
+       COALESCE(NULLIF(m.imdb_rating, ''), 'N/A') as imdb_rating,
+       r.avg_score, r.num_reviews
+FROM (
+    SELECT movie_id, MAX(movie_name) as movie_name,
+           AVG(review_score) as avg_score, COUNT(*) as num_reviews
+    FROM movie_reviews
+    WHERE guild_id = $1
+    GROUP BY movie_id
+    ORDER BY avg_score DESC
+    LIMIT 25
+) r
+LEFT JOIN movies m ON m.movie_id = r.movie_id
+ORDER BY r.avg_score DESC
+"""
+
+# Embed field templates for list_reviews, filled straight from the record.
+_LIST_REVIEWS_FIELD_NAME = "{title} ({year})".format_map
+_LIST_REVIEWS_FIELD_VALUE = (
+    "- Average Score: {avg_score:.1f}\n"
+    "- Reviews: {num_reviews}\n"
+    "- IMDB Rating: {imdb_rating}"
+).format_map
+
+# Same 25 field embed limit as above, one field per review.
+_SQL_REVIEWED_MOVIE_STATS = """
+SELECT user_id, user_name, review_score, review_time, movie_id
+FROM movie_reviews
+WHERE guild_id = $1 AND lower(movie_name) LIKE lower($2)
+ORDER BY review_time ASC
+LIMIT 25
+"""
+
+_SQL_SEARCH_REVIEWED_MOVIES = """
+SELECT DISTINCT movie_name
+FROM movie_reviews
+WHERE guild_id = $1 AND lower(movie_name) LIKE lower($2)
+LIMIT 5
+"""
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a search query for use as a cache key.
+
+    Casefolds, turns punctuation into spaces and collapses whitespace, so e.g.
+    "The Matrix" and "the  matrix!" share a cache entry, while word
+    boundaries such as the one in "spider-man" are kept.
+
+    Args:
+        query (str): The raw search query.
+
+    Returns:
+        str: The normalized query.
+    """
+    return " ".join(_PUNCTUATION_RE.sub(" ", query.casefold()).split())
 
 
 class ReviewSelect(discord.ui.Select):  # type: ignore
     """A class to represent a select menu for reviewing a movie."""
 
-    def __init__(self, bot: RumbleReviewsBot, movie_id: str, movie_name: str) -> None:
+    _OPTIONS = [discord.SelectOption(label=str(i), value=str(i)) for i in range(1, 11)]
+
+    def __init__(self, bot: RumbleReviewsBot, movie_id: str, movie: OmdbMovie) -> None:
         """Initialize the ReviewSelect class."""
         self.bot = bot
         self.movie_id = movie_id
-        self.movie_name = movie_name
-
-        options = [
-            discord.SelectOption(label=str(i), value=str(i)) for i in range(1, 11)
-        ]
+        self.movie = movie
+        self.movie_name = movie.title
 
         super().__init__(
-            placeholder="Rate the movie", min_values=1, max_values=1, options=options
+            placeholder="Rate the movie",
+            min_values=1,
+            max_values=1,
+            options=self._OPTIONS,
         )
 
     async def callback(self, interaction: discord.Interaction) -> None:
@@ -39,24 +145,25 @@ class ReviewSelect(discord.ui.Select):  # type: ignore
         guild_id = interaction.guild.id  # type: ignore
         user_id = user.id
         user_name = user.display_name
-        review_time = datetime.datetime.utcnow()
 
-        async with self.bot.pg_pool.acquire() as conn:  # type: ignore
-            await conn.execute(  # type: ignore
-                """
-                INSERT INTO movie_reviews (guild_id, user_id, user_name, movie_id, movie_name, review_score, review_time)
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
-                ON CONFLICT (guild_id, user_id, movie_id) DO UPDATE
-                SET review_score = EXCLUDED.review_score, review_time = EXCLUDED.review_time
-                """,
-                guild_id,
-                user_id,
-                user_name,
-                self.movie_id,
-                self.movie_name,
-                score,
-                review_time,
+        # Look the cog up on every callback, this view may outlive a cog reload.
+        cog: Optional[Review] = self.bot.get_cog("Review")  # type: ignore
+        if cog is None:
+            await interaction.response.send_message(
+                "Reviews are unavailable right now, please try again.", ephemeral=True
             )
+            return
+
+        cog.queue_review(
+            (
+                self.movie_id,
+                self.movie.title,
+                self.movie.year,
+                self.movie.poster,
+                self.movie.imdb_rating,
+            ),
+            (guild_id, user_id, user_name, self.movie_id, self.movie_name, score),
+        )
 
         await interaction.response.send_message(
             f"Thank you for your review of {score}/10!", ephemeral=True
@@ -66,20 +173,238 @@ class ReviewSelect(discord.ui.Select):  # type: ignore
 class ReviewView(discord.ui.View):
     """A class to represent a view for reviewing a movie."""
 
-    def __init__(self, bot: RumbleReviewsBot, movie_id: str, movie_name: str) -> None:
+    def __init__(self, bot: RumbleReviewsBot, movie_id: str, movie: OmdbMovie) -> None:
         """Initialize the ReviewView class."""
         super().__init__(timeout=None)
-        self.add_item(ReviewSelect(bot, movie_id, movie_name))
+        self.add_item(ReviewSelect(bot, movie_id, movie))
 
 
-class Review(commands.Cog):
+class Review(commands.Cog):  # pylint:disable=too-many-instance-attributes
     """A class to represent the Review cog."""
 
     def __init__(self, bot: RumbleReviewsBot) -> None:
         """Initialize the Review cog."""
         self.bot = bot
+        self._base_params = {"apikey": bot.env_loader.OMDB_API_KEY}
+        self._omdb_semaphore = asyncio.Semaphore(OMDB_MAX_CONCURRENCY)
+        self._prefetch_semaphore = asyncio.Semaphore(OMDB_PREFETCH_CONCURRENCY)
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self._search_cache: TTLCache[str, List[OmdbSearch]] = TTLCache(
+            maxsize=1024, ttl=3600
+        )
+        self._movie_cache: TTLCache[str, OmdbMovie] = TTLCache(maxsize=1024, ttl=3600)
+        self._autocomplete_tasks: dict[
+            int, asyncio.Task[Optional[List[OmdbSearch]]]
+        ] = {}
+        self._prefetch_tasks: dict[str, asyncio.Task[Optional[OmdbMovie]]] = {}
+        # Only needed until the user's next keystroke, so entries expire quickly.
+        self._user_prefetches: TTLCache[
+            int, List[asyncio.Task[Optional[OmdbMovie]]]
+        ] = TTLCache(maxsize=1024, ttl=60)
+        self._reviewed_names_cache: TTLCache[tuple[int, str], list[str]] = TTLCache(
+            maxsize=4096, ttl=45
+        )
+        self._user_cache: TTLCache[int, discord.User] = TTLCache(maxsize=1024, ttl=3600)
+        self._user_fetch_semaphore = asyncio.Semaphore(USER_FETCH_CONCURRENCY)
+        self._pending_reviews: asyncio.Queue[Optional[_PendingReview]] = asyncio.Queue()
+        self._review_writer: asyncio.Task[None] | None = None
+
+    async def cog_load(self) -> None:
+        """Start the background task that writes reviews in batches."""
+        self._review_writer = asyncio.create_task(self._write_reviews())
+
+    async def cog_unload(self) -> None:
+        """Cancel pending OMDB requests and flush queued reviews."""
+        for task in (*self._prefetch_tasks.values(), *self._inflight.values()):
+            task.cancel()
+        if self._review_writer is not None:
+            self._pending_reviews.put_nowait(None)
+            await self._review_writer
+
+    def queue_review(
+        self, movie_args: tuple[Any, ...], review_args: tuple[Any, ...]
+    ) -> None:
+        """
+        Queue a review to be written by the background review writer.
+
+        Args:
+            movie_args (tuple[Any, ...]): The arguments for the movie upsert.
+            review_args (tuple[Any, ...]): The arguments for the review upsert.
+        """
+        self._pending_reviews.put_nowait((movie_args, review_args))
+
+    async def _write_reviews(self) -> None:
+        """
+        Write queued reviews until a ``None`` sentinel is received.
+
+        A batch is flushed once it holds REVIEW_BATCH_SIZE reviews or
+        REVIEW_BATCH_DELAY seconds after its first review arrived.
+        """
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._pending_reviews.get()
+            if first is None:
+                break
+
+            batch = [first]
+            deadline = loop.time() + REVIEW_BATCH_DELAY
+            while len(batch) < REVIEW_BATCH_SIZE:
+                try:
+                    pending = await asyncio.wait_for(
+                        self._pending_reviews.get(), deadline - loop.time()
+                    )
+                except asyncio.TimeoutError:
+                    break
+                if pending is None:
+                    stopping = True
+                    break
+                batch.append(pending)
+
+            try:
+                await self._write_review_batch(batch)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception(
+                    "Failed to write a batch of %s reviews, retrying one by one",
+                    len(batch),
+                )
+                await self._write_reviews_one_by_one(batch)
+
+    async def _write_review_batch(self, batch: List[_PendingReview]) -> None:
+        """Write a batch of reviews in a single transaction."""
+        async with self.bot.pg_pool.acquire() as conn:  # type: ignore
+            async with conn.transaction():  # type: ignore
+                await conn.executemany(  # type: ignore
+                    # Sorted by movie_id, the same lock order as _backfill_movies.
+                    _SQL_UPSERT_MOVIE,
+                    sorted((movie for movie, _ in batch), key=lambda movie: movie[0]),
+                )
+                await conn.executemany(  # type: ignore
+                    _SQL_UPSERT_REVIEW, [review for _, review in batch]
+                )
+
+    async def _write_reviews_one_by_one(self, batch: List[_PendingReview]) -> None:
+        """
+        Write each review of a failed batch in its own transaction.
+
+        One bad row no longer loses the whole batch, and reviews that still
+        fail are logged with their arguments so they can be recovered.
+        """
+        for review in batch:
+            try:
+                await self._write_review_batch([review])
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed to write review: %s", review)
+
+    def prefetch_movie_imdb_data(
+        self, imdb_ids: List[str]
+    ) -> List[asyncio.Task[Optional[OmdbMovie]]]:
+        """
+        Warm the movie cache for IMDB IDs in the background.
+
+        At most OMDB_PREFETCH_CONCURRENCY prefetches run at once, so they never
+        crowd out interactive requests.
+
+        Args:
+            imdb_ids (List[str]): The IMDB IDs to fetch, cached or in-flight IDs are skipped.
 
-    async def fetch_movie_imdb_data(self, query: str) -> Optional[List[dict[str, Any]]]:
+        Returns:
+            List[asyncio.Task[Optional[OmdbMovie]]]: The prefetches started.
+        """
+        tasks = []
+        for imdb_id in imdb_ids:
+            if imdb_id in self._movie_cache or imdb_id in self._prefetch_tasks:
+                continue
+            task = asyncio.create_task(self._prefetch_movie(imdb_id))
+            self._prefetch_tasks[imdb_id] = task
+            task.add_done_callback(functools.partial(self._on_prefetch_done, imdb_id))
+            tasks.append(task)
+        return tasks
+
+    async def _prefetch_movie(self, imdb_id: str) -> Optional[OmdbMovie]:
+        """Fetch a movie once a prefetch slot is free."""
+        async with self._prefetch_semaphore:
+            return await self.fetch_movie_imdb_data_by_imdb_id(imdb_id)
+
+    def _on_prefetch_done(
+        self, imdb_id: str, task: asyncio.Task[Optional[OmdbMovie]]
+    ) -> None:
+        """Forget a finished prefetch and log its failure, if any."""
+        if self._prefetch_tasks.get(imdb_id) is task:
+            del self._prefetch_tasks[imdb_id]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "Failed to prefetch IMDB data for %s: %s", imdb_id, task.exception()
+            )
+
+    async def _omdb_get(
+        self, key: str, params: dict[str, str], decoder: msgspec.json.Decoder[Any]
+    ) -> Any:
+        """
+        Send a request to the OMDB API, sharing it with identical in-flight ones.
+
+        Callers asking for the same key while a request is running await that
+        request instead of sending their own. The request is shielded, so a
+        cancelled caller does not cancel it for the others.
+
+        Args:
+            key (str): Identifies the request, equal keys are coalesced.
+            params (dict[str, str]): The query parameters, besides the API key.
+            decoder (msgspec.json.Decoder[Any]): Decodes the response body.
+
+        Returns:
+            Any: The decoded response, see _omdb_request.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._omdb_request(params, decoder))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _omdb_request(
+        self, params: dict[str, str], decoder: msgspec.json.Decoder[Any]
+    ) -> Any:
+        """
+        Send a request to the OMDB API.
+
+        At most OMDB_MAX_CONCURRENCY requests are in flight at once.
+
+        Args:
+            params (dict[str, str]): The query parameters, besides the API key.
+            decoder (msgspec.json.Decoder[Any]): Decodes the response body into
+                the expected struct or an OmdbError.
+
+        Returns:
+            Any: The decoded response, or None if the request timed out or
+                failed, or OMDB did not return a successful JSON response.
+        """
+        async with self._omdb_semaphore:
+            try:
+                async with self.bot.http_session.get(  # type: ignore
+                    OMDB_API_URL, params={**self._base_params, **params}
+                ) as resp:
+                    if resp.status != 200 or resp.content_type != "application/json":
+                        return None
+                    body = await resp.read()
+            except asyncio.TimeoutError:
+                logger.warning("OMDB request timed out: %s", params)
+                return None
+            except aiohttp.ClientError as exc:
+                logger.warning("OMDB request failed for %s: %r", params, exc)
+                return None
+
+        try:
+            result = decoder.decode(body)
+        except msgspec.DecodeError as exc:
+            logger.warning("Unexpected OMDB response for %s: %s", params, exc)
+            return None
+
+        if isinstance(result, OmdbError):
+            return None
+        return result
+
+    async def fetch_movie_imdb_data(self, query: str) -> Optional[List[OmdbSearch]]:
         """
         Fetch movie data from the OMDB API.
 
@@ -87,21 +412,24 @@ class Review(commands.Cog):
             query (str): The query to search for.
 
         Returns:
-            Optional[List[dict[str, Any]]]: The search results from the OMDB API.
+            Optional[List[OmdbSearch]]: The search results from the OMDB API.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"http://www.omdbapi.com/?s={query}&apikey={self.bot.env_loader.OMDB_API_KEY}"
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    if data["Response"] == "True":
-                        return data["Search"]
-                return None
+        key = normalize_query(query)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached
+
+        results: Optional[OmdbSearchResults] = await self._omdb_get(
+            f"s:{key}", {"s": query.strip()}, _SEARCH_DECODER
+        )
+        if results is None:
+            return None
+        self._search_cache[key] = results.search
+        return results.search
 
     async def fetch_movie_imdb_data_by_imdb_id(
         self, imdb_id: str
-    ) -> Optional[dict[str, Any]]:
+    ) -> Optional[OmdbMovie]:
         """
         Fetch movie data from the OMDB API by IMDB ID.
 
@@ -109,17 +437,19 @@ class Review(commands.Cog):
             imdb_id (str): The IMDB ID to search for.
 
         Returns:
-            Optional[dict[str, Any]]: The movie data from the OMDB API.
+            Optional[OmdbMovie]: The movie data from the OMDB API.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"http://www.omdbapi.com/?i={imdb_id}&apikey={self.bot.env_loader.OMDB_API_KEY}"
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    if data["Response"] == "True":
-                        return data
-                return None
+        cached = self._movie_cache.get(imdb_id)
+        if cached is not None:
+            return cached
+
+        movie: Optional[OmdbMovie] = await self._omdb_get(
+            f"i:{imdb_id}", {"i": imdb_id}, _MOVIE_DECODER
+        )
+        if movie is None:
+            return None
+        self._movie_cache[imdb_id] = movie
+        return movie
 
     @app_commands.command(name="review", description="Review a movie or tv show.")
     @app_commands.describe(name="Search by the name of the show.")
@@ -137,15 +467,13 @@ class Review(commands.Cog):
         logger.info("Reviewing IMDB movie: %s", imdb_id)
         await interaction.response.defer()
 
-        imdb_data = await self.fetch_movie_imdb_data_by_imdb_id(imdb_id)
+        # Joins the autocomplete prefetch for this movie if it is still running.
+        movie_data = await self.fetch_movie_imdb_data_by_imdb_id(imdb_id)
 
-        if not imdb_data:
+        if not movie_data:
             await interaction.followup.send("Movie not found.")
             return
 
-        movie_data = OmdbMovie.from_dict(imdb_data)
-        movie_name = movie_data.title
-
         embed = discord.Embed(
             title=f"Review: {movie_data.title}",
             description=f"{movie_data.plot[:200]}",
@@ -160,16 +488,20 @@ class Review(commands.Cog):
         embed.add_field(name="IMDB Votes", value=movie_data.imdb_votes)
         embed.add_field(name="Box Office", value=movie_data.box_office)
 
-        view = ReviewView(self.bot, imdb_id, movie_name)
+        view = ReviewView(self.bot, imdb_id, movie_data)
         await interaction.followup.send(embed=embed, view=view)
 
     @review.autocomplete("name")
     async def play_autocomplete(
-        self, _: discord.Interaction, current: str
+        self, interaction: discord.Interaction, current: str
     ) -> List[app_commands.Choice[str]]:
         """
         Autocomplete for the review command.
 
+        Only the latest keystroke per user is answered, earlier ones still
+        waiting on OMDB are cancelled. Their shared request keeps running and
+        fills the search cache.
+
         Args:
             interaction (discord.Interaction): The interaction.
             current (str): The current string.
@@ -187,7 +519,26 @@ class Review(commands.Cog):
                 ),
             ]
 
-        query_searched = await self.fetch_movie_imdb_data(current.lower())
+        user_id = interaction.user.id
+        previous = self._autocomplete_tasks.pop(user_id, None)
+        if previous is not None:
+            previous.cancel()
+        # Results of the user's previous keystroke are no longer on screen.
+        for prefetch in self._user_prefetches.pop(user_id, ()):
+            prefetch.cancel()
+
+        task = asyncio.create_task(self.fetch_movie_imdb_data(current.lower()))
+        self._autocomplete_tasks[user_id] = task
+        try:
+            query_searched = await task
+        except asyncio.CancelledError:
+            if self._autocomplete_tasks.get(user_id) is task:
+                raise
+            # Superseded by a newer keystroke from the same user.
+            return []
+        finally:
+            if self._autocomplete_tasks.get(user_id) is task:
+                del self._autocomplete_tasks[user_id]
 
         if query_searched is None:
             return [
@@ -197,15 +548,18 @@ class Review(commands.Cog):
                 )
             ]
 
-        formatted_search_results: List[OmdbSearch] = [
-            OmdbSearch.from_dict(x) for x in query_searched
-        ]
+        formatted_search_results = query_searched[:limit]
+
+        # The user will most likely pick one of these, so have /review hit the cache.
+        self._user_prefetches[user_id] = self.prefetch_movie_imdb_data(
+            [result.imdb_id for result in formatted_search_results]
+        )
 
         return [
             app_commands.Choice(
                 name=f"{result.title} - ({result.year})", value=result.imdb_id
             )
-            for result in formatted_search_results[:limit]
+            for result in formatted_search_results
         ]
 
     @app_commands.command(
@@ -223,47 +577,81 @@ class Review(commands.Cog):
             None
         """
         guild_id = interaction.guild.id  # type: ignore
-        async with self.bot.pg_pool.acquire() as conn:  # type: ignore
+        await interaction.response.defer()
 
-            rows = await conn.fetch(  # type: ignore
-                """
-                SELECT movie_id, movie_name, AVG(review_score) as avg_score, COUNT(review_score) as num_reviews
-                FROM movie_reviews
-                WHERE guild_id = $1
-                GROUP BY movie_id, movie_name
-                ORDER BY avg_score DESC
-                """,
-                guild_id,
-            )
+        rows = await self.bot.pg_pool.fetch(  # type: ignore
+            _SQL_LIST_REVIEWS,
+            guild_id,
+        )
 
-            if not rows:
-                await interaction.response.send_message(
-                    "No reviews found for this server."
-                )
-                return
+        if not rows:
+            await interaction.followup.send("No reviews found for this server.")
+            return
 
-            movies: list[tuple[OmdbMovie, str, str]] = []
-            for row in rows:  # type: ignore
-                movie_data = await self.fetch_movie_imdb_data_by_imdb_id(
-                    row["movie_id"]  # type: ignore
-                )
-                if movie_data:
-                    movie_info = OmdbMovie.from_dict(movie_data)
-                    movies.append((movie_info, row["avg_score"], row["num_reviews"]))  # type: ignore
+        backfilled = await self._backfill_movies(
+            [row["movie_id"] for row in rows if row["missing"]]  # type: ignore
+        )
+
+        embed = discord.Embed(
+            title="Movies Reviewed in this Server",
+            color=discord.Color.blue(),
+        )
 
-            embed = discord.Embed(
-                title="Movies Reviewed in this Server",
-                color=discord.Color.blue(),
+        for row in rows:  # type: ignore
+            fields = row
+            movie = backfilled.get(row["movie_id"])  # type: ignore
+            if movie is not None:
+                fields = {
+                    **row,
+                    "title": movie.title,
+                    "year": movie.year or "N/A",
+                    "imdb_rating": movie.imdb_rating or "N/A",
+                }
+            embed.add_field(
+                name=_LIST_REVIEWS_FIELD_NAME(fields),
+                value=_LIST_REVIEWS_FIELD_VALUE(fields),
+                inline=False,
             )
 
-            for movie, avg_score, num_reviews in movies:
-                embed.add_field(
-                    name=f"{movie.title} ({movie.year})",
-                    value=f"- Average Score: {avg_score:.1f}\n- Reviews: {num_reviews}\n- IMDB Rating: {movie.imdb_rating}",
-                    inline=False,
-                )
+        await interaction.followup.send(embed=embed)
+
+    async def _backfill_movies(self, imdb_ids: List[str]) -> dict[str, OmdbMovie]:
+        """
+        Fetch and store movies that were reviewed before the movies table existed.
+
+        Args:
+            imdb_ids (List[str]): IMDB IDs with no row in the movies table, at
+                most the 25 listed by list_reviews.
 
-            await interaction.response.send_message(embed=embed)
+        Returns:
+            dict[str, OmdbMovie]: The movies that OMDB returned, by IMDB ID.
+        """
+        if not imdb_ids:
+            return {}
+
+        results = await asyncio.gather(
+            *(self.fetch_movie_imdb_data_by_imdb_id(imdb_id) for imdb_id in imdb_ids)
+        )
+        movies = {
+            imdb_id: movie
+            for imdb_id, movie in zip(imdb_ids, results)
+            if movie is not None
+        }
+        if not movies:
+            return movies
+
+        # Storing them is best effort, the listing can use the fetched movies.
+        try:
+            await self.bot.pg_pool.executemany(  # type: ignore
+                _SQL_UPSERT_MOVIE,
+                [
+                    (imdb_id, movie.title, movie.year, movie.poster, movie.imdb_rating)
+                    for imdb_id, movie in sorted(movies.items())
+                ],
+            )
+        except asyncpg.PostgresError:
+            logger.exception("Failed to store %s backfilled movies", len(movies))
+        return movies
 
     @app_commands.command(
         name="get_reviewed_movie_stats",
@@ -280,61 +668,109 @@ class Review(commands.Cog):
             name (str): The name of the movie to search for.
         """
         guild_id = interaction.guild.id  # type: ignore
+        await interaction.response.defer()
 
-        async with self.bot.pg_pool.acquire() as conn:  # type: ignore
-            rows = await conn.fetch(  # type: ignore
-                """
-                SELECT user_id, user_name, review_score, review_time, movie_id, movie_name
-                FROM movie_reviews
-                WHERE guild_id = $1 AND movie_name ILIKE $2
-                ORDER BY review_time ASC
-                """,
-                guild_id,
-                name,
+        rows = await self.bot.pg_pool.fetch(  # type: ignore
+            _SQL_REVIEWED_MOVIE_STATS,
+            guild_id,
+            name,
+        )
+
+        if not rows:
+            await interaction.followup.send(
+                "No reviews found for this movie in this server."
             )
+            return
+
+        imdb_id: str = rows[0]["movie_id"]  # type: ignore
+
+        movie_data, users = await asyncio.gather(
+            self.fetch_movie_imdb_data_by_imdb_id(imdb_id),
+            self._resolve_users(
+                interaction.guild, [row["user_id"] for row in rows]  # type: ignore
+            ),
+        )
+        if not movie_data:
+            await interaction.followup.send("Movie not found.")
+            return
+
+        embed = discord.Embed(
+            title=f"Reviews for {movie_data.title} ({movie_data.year})",
+            color=discord.Color.blue(),
+        )
+        embed.set_thumbnail(url=movie_data.poster)
 
-            if not rows:
-                await interaction.response.send_message(
-                    "No reviews found for this movie in this server."
+        for row in rows:  # type: ignore
+            user = users.get(row["user_id"])  # type: ignore
+            if user:
+                user_name = user.name
+                user_avatar = (
+                    user.avatar.url if user.avatar else user.default_avatar.url
                 )
-                return
+            else:
+                user_name = row["user_name"]  # type: ignore
+                user_avatar = None
+
+            review_time = row["review_time"].strftime("%Y-%m-%d %H:%M:%S")  # type: ignore
+            embed.add_field(
+                name=f"{user_name} ({review_time})",
+                value=f"Score: {row['review_score']}",
+                inline=False,
+            )
+            if user_avatar:
+                embed.set_thumbnail(url=user_avatar)
 
-            imdb_id: str = rows[0]["movie_id"]  # type: ignore
+        await interaction.followup.send(embed=embed)
 
-            imdb_data = await self.fetch_movie_imdb_data_by_imdb_id(imdb_id)  # type: ignore
-            if not imdb_data:
-                await interaction.response.send_message("Movie not found.")
-                return
+    async def _resolve_users(
+        self, guild: Optional[discord.Guild], user_ids: List[int]
+    ) -> dict[int, discord.abc.User]:
+        """
+        Look up the Discord users who wrote some reviews.
 
-            movie_data = OmdbMovie.from_dict(imdb_data)
+        The bot runs without the members intent, so its user cache is mostly
+        empty. Users are taken from the client or guild cache when possible,
+        otherwise fetched from the API, at most USER_FETCH_CONCURRENCY at a
+        time, and kept in a TTL cache.
 
-            embed = discord.Embed(
-                title=f"Reviews for {movie_data.title} ({movie_data.year})",
-                color=discord.Color.blue(),
-            )
-            embed.set_thumbnail(url=movie_data.poster)
-
-            for row in rows:  # type: ignore
-                user = self.bot.get_user(row["user_id"])  # type: ignore
-                if user:
-                    user_name = user.name
-                    user_avatar = (
-                        user.avatar.url if user.avatar else user.default_avatar.url
-                    )
-                else:
-                    user_name = row["user_name"]  # type: ignore
-                    user_avatar = None
-
-                review_time = row["review_time"].strftime("%Y-%m-%d %H:%M:%S")  # type: ignore
-                embed.add_field(
-                    name=f"{user_name} ({review_time})",
-                    value=f"Score: {row['review_score']}",
-                    inline=False,
-                )
-                if user_avatar:
-                    embed.set_thumbnail(url=user_avatar)
+        Args:
+            guild (Optional[discord.Guild]): The guild the reviews belong to.
+            user_ids (List[int]): The IDs of the review authors.
 
-            await interaction.response.send_message(embed=embed)
+        Returns:
+            dict[int, discord.abc.User]: The users that could be found, by ID.
+        """
+        users: dict[int, discord.abc.User] = {}
+        missing: list[int] = []
+        for user_id in dict.fromkeys(user_ids):
+            user = (
+                self.bot.get_user(user_id)
+                or (guild.get_member(user_id) if guild else None)
+                or self._user_cache.get(user_id)
+            )
+            if user is None:
+                missing.append(user_id)
+            else:
+                users[user_id] = user
+
+        fetched = await asyncio.gather(
+            *(self._fetch_user(user_id) for user_id in missing),
+            return_exceptions=True,
+        )
+        for user_id, result in zip(missing, fetched):
+            if isinstance(result, discord.User):
+                self._user_cache[user_id] = result
+                users[user_id] = result
+            elif isinstance(result, discord.HTTPException):
+                logger.warning("Failed to fetch user %s: %s", user_id, result)
+            elif isinstance(result, BaseException):
+                raise result
+        return users
+
+    async def _fetch_user(self, user_id: int) -> discord.User:
+        """Fetch a user from the Discord API once a fetch slot is free."""
+        async with self._user_fetch_semaphore:
+            return await self.bot.fetch_user(user_id)
 
     @get_reviewed_movie_stats.autocomplete("name")
     async def autocomplete_reviewed_movie(
@@ -350,33 +786,30 @@ class Review(commands.Cog):
         Returns:
             List[app_commands.Choice[str]]: The list of choices.
         """
-        guild_id = interaction.guild.id  # type: ignore
+        guild_id: int = interaction.guild.id  # type: ignore
+        key = (guild_id, current.lower())
 
-        async with self.bot.pg_pool.acquire() as conn:  # type: ignore
-            rows = await conn.fetch(  # type: ignore
-                """
-                SELECT DISTINCT movie_name
-                FROM movie_reviews
-                WHERE guild_id = $1 AND movie_name ILIKE $2
-                LIMIT 5
-                """,
+        movie_names = self._reviewed_names_cache.get(key)
+        if movie_names is None:
+            rows = await self.bot.pg_pool.fetch(  # type: ignore
+                _SQL_SEARCH_REVIEWED_MOVIES,
                 guild_id,
                 f"%{current}%",
             )
+            movie_names = [row["movie_name"] for row in rows]  # type: ignore
+            self._reviewed_names_cache[key] = movie_names
 
-            if not rows:
-                return [
-                    app_commands.Choice(
-                        name="No matching reviewed movies found.", value=""
-                    )
-                ]
-
-            choices: list[app_commands.Choice[str]] = [
-                app_commands.Choice(name=row["movie_name"], value=row["movie_name"])  # type: ignore
-                for row in rows  # type: ignore
+        if not movie_names:
+            return [
+                app_commands.Choice(name="No matching reviewed movies found.", value="")
             ]
 
-            return choices
+        choices: list[app_commands.Choice[str]] = [
+            app_commands.Choice(name=movie_name, value=movie_name)
+            for movie_name in movie_names
+        ]
+
+        return choices
 
 
 async def setup(bot: RumbleReviewsBot) -> None:
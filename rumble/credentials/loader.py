@@ -1,33 +1,72 @@
 """Credentials Loader"""
 
+import dataclasses
+import functools
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, get_type_hints
 
 import dotenv
 
-dotenv.load_dotenv(dotenv_path=".env")  ## Load enviroment variables.
+REQUIRED_VARIABLES = (
+    "DISCORD_BOT_TOKEN",
+    "DATABASE_URL",
+    "APPLICATION_ID",
+    "OMDB_API_KEY",
+)
 
 
-@dataclass
+@dataclass(frozen=True)
 class EnvLoader:  # pylint:disable=too-many-instance-attributes
     """
     Class for loading environments
     """
 
     # Bot Info
-    DISCORD_BOT_TOKEN: str = os.getenv("DISCORD_BOT_TOKEN", default="")
+    DISCORD_BOT_TOKEN: str = ""
 
-    DATABASE_URL: str = os.getenv("DATABASE_URL", default="")
-    APPLICATION_ID: str = os.getenv("APPLICATION_ID", default="")
+    DATABASE_URL: str = ""
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 20
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = 300.0
+    DB_COMMAND_TIMEOUT: float = 10.0
+    APPLICATION_ID: str = ""
 
-    OMDB_API_KEY: str = os.getenv("OMDB_API_KEY", default="")
+    OMDB_API_KEY: str = ""
 
     def __post_init__(self) -> None:
         """
-        Post init method
+        Post init method, validates that all required variables are set.
+
+        Uses explicit checks rather than asserts, which ``python -O`` strips.
         """
-        assert self.DISCORD_BOT_TOKEN, "DISCORD_BOT_TOKEN is not set"
-        assert self.DATABASE_URL, "DATABASE_URL is not set"
-        assert self.APPLICATION_ID, "APPLICATION_ID is not set"
-        assert self.OMDB_API_KEY, "OMDB_API_KEY is not set"
+        for name in REQUIRED_VARIABLES:
+            if not getattr(self, name):
+                raise RuntimeError(f"{name} is not set")
+
+
+@functools.lru_cache(maxsize=None)
+def load_env(dotenv_path: str = ".env") -> EnvLoader:
+    """
+    Load the .env file and build the EnvLoader, only once per path.
+
+    Called from the bot entrypoint so importing this module does no file I/O.
+    Unset variables keep the EnvLoader defaults, numeric ones are converted
+    to the field's type.
+    """
+    dotenv.load_dotenv(dotenv_path=dotenv_path)  ## Load enviroment variables.
+
+    # Resolved here rather than read from Field.type, which may be a string.
+    field_types = get_type_hints(EnvLoader)
+    values: dict[str, Any] = {}
+    for env_field in dataclasses.fields(EnvLoader):
+        value = os.getenv(env_field.name)
+        if value is None:
+            continue
+        try:
+            values[env_field.name] = field_types[env_field.name](value)
+        except ValueError:
+            raise RuntimeError(
+                f"{env_field.name} must be a number, got {value!r}"
+            ) from None
+    return EnvLoader(**values)
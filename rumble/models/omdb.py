@@ -1,13 +1,24 @@
 """
-This module contains dataclasses to represent data from the OMDB API.
+This module contains structs to represent data from the OMDB API.
+
+OMDB responses are decoded straight from the response body into these structs
+with msgspec, the ``Response`` field tells a result apart from an error.
 """
 
-import typing as t
-from dataclasses import dataclass
+import msgspec
 
 
-@dataclass
-class OmdbSearch:
+class OmdbSearch(
+    msgspec.Struct,
+    frozen=True,
+    rename={
+        "title": "Title",
+        "year": "Year",
+        "imdb_id": "imdbID",
+        "poster": "Poster",
+        "type": "Type",
+    },
+):
     """
     A class to represent a search result from the OMDB API.
     """
@@ -18,28 +29,43 @@ class OmdbSearch:
     poster: str
     type: str
 
-    @classmethod
-    def from_dict(cls, data: dict[str, t.Any]) -> "OmdbSearch":
-        """
-        Create an instance of OmdbSearch from a dictionary.
 
-        Args:
-            data (dict): The dictionary to create the instance from.
+class OmdbSearchResults(
+    msgspec.Struct,
+    frozen=True,
+    tag_field="Response",
+    tag="True",
+    rename={"search": "Search"},
+):
+    """
+    A class to represent a successful search response from the OMDB API.
+    """
 
-        Returns:
-            An instance of OmdbSearch.
-        """
-        return cls(
-            title=data["Title"],
-            year=data["Year"],
-            imdb_id=data["imdbID"],
-            poster=data["Poster"],
-            type=data["Type"],
-        )
+    search: list[OmdbSearch]
 
 
-@dataclass
-class OmdbMovie:
+class OmdbMovie(
+    msgspec.Struct,
+    frozen=True,
+    tag_field="Response",
+    tag="True",
+    rename={
+        "title": "Title",
+        "year": "Year",
+        "rated": "Rated",
+        "released": "Released",
+        "runtime": "Runtime",
+        "genre": "Genre",
+        "director": "Director",
+        "writer": "Writer",
+        "actors": "Actors",
+        "plot": "Plot",
+        "box_office": "BoxOffice",
+        "poster": "Poster",
+        "imdb_rating": "imdbRating",
+        "imdb_votes": "imdbVotes",
+    },
+):
     """
     A class to represent a movie from the OMDB API.
     """
@@ -61,30 +87,16 @@ class OmdbMovie:
     imdb_rating: str = ""
     imdb_votes: str = ""
 
-    @classmethod
-    def from_dict(cls, data: dict[str, t.Any]) -> "OmdbMovie":
-        """
-        Create an instance of OmdbMovie from a dictionary.
 
-        Args:
-            data (dict): The dictionary to create the instance from.
+class OmdbError(
+    msgspec.Struct,
+    frozen=True,
+    tag_field="Response",
+    tag="False",
+    rename={"error": "Error"},
+):
+    """
+    A class to represent an error response from the OMDB API.
+    """
 
-        Returns:
-            An instance of OmdbMovie.
-        """
-        return cls(
-            title=data["Title"],
-            year=data["Year"],
-            rated=data["Rated"],
-            released=data["Released"],
-            runtime=data["Runtime"],
-            genre=data["Genre"],
-            director=data["Director"],
-            writer=data["Writer"],
-            actors=data["Actors"],
-            plot=data["Plot"],
-            box_office=data.get("BoxOffice", ""),
-            poster=data.get("Poster", ""),
-            imdb_rating=data.get("imdbRating", ""),
-            imdb_votes=data.get("imdbVotes", ""),
-        )
+    error: str = ""
@@ -2,23 +2,69 @@
 Just a function for loading all cogs for the client
 """
 
+import asyncio
 import logging as logger
 import os
 
 from discord.ext import commands
 
+COGS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "cogs")
+
+
+def _find_cog_modules() -> tuple[str, ...]:
+    """Return the module names of all cogs in rumble/cogs."""
+    with os.scandir(COGS_DIR) as entries:
+        return tuple(
+            f"rumble.cogs.{entry.name[:-3]}"
+            for entry in entries
+            if entry.is_file()
+            and entry.name.endswith(".py")
+            and not entry.name.startswith("_")
+        )
+
+
+# Filled on first use, so importing this module does no file I/O.
+_COG_MODULES: tuple[str, ...] | None = None
+
+
+def _cog_modules() -> tuple[str, ...]:
+    """Return the cached cog module names, scanning rumble/cogs the first time."""
+    global _COG_MODULES  # pylint: disable=global-statement
+    if _COG_MODULES is None:
+        _COG_MODULES = _find_cog_modules()
+    return _COG_MODULES
+
+
+def refresh_cog_list() -> None:
+    """Rescan rumble/cogs, e.g. after adding a cog during development."""
+    global _COG_MODULES  # pylint: disable=global-statement
+    _COG_MODULES = _find_cog_modules()
+
+
+def _log_results(modules: tuple[str, ...], results: list[BaseException | None]):
+    """Log the outcome of loading each cog module."""
+    for module, result in zip(modules, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to load {module}", exc_info=result)
+        else:
+            logger.info(f"Loaded {module}")
+
 
 async def cog_loader(client: commands.Bot):
     """unloads all cogs."""
-    for filename in os.listdir("rumble/cogs"):
-        if filename.endswith(".py") and not filename.startswith("_"):
-            await client.load_extension(f"rumble.cogs.{filename[:-3]}")
-            logger.info(f"Loaded rumble.cogs.{filename[:-3]}")
+    modules = _cog_modules()
+    results = await asyncio.gather(
+        *(client.load_extension(module) for module in modules),
+        return_exceptions=True,
+    )
+    _log_results(modules, results)
 
 
 async def cog_reloader(client: commands.Bot):
     """reload all cogs."""
-    for filename in os.listdir("rumble/cogs"):
-        if filename.endswith(".py") and not filename.startswith("_"):
-            await client.reload_extension(f"rumble.cogs.{filename[:-3]}")
-            logger.info(f"Loaded rumble.cogs.{filename[:-3]}")
+    modules = _cog_modules()
+    results = await asyncio.gather(
+        *(client.reload_extension(module) for module in modules),
+        return_exceptions=True,
+    )
+    _log_results(modules, results)